@@ -3,12 +3,24 @@
 
 import argparse
 import sys
+from collections import Counter
 from pathlib import Path
 
-from smart_parser.io import read_transactions_csv, write_clean_csv
+from smart_parser.io import ChunkReadError, read_transactions_csv, write_clean_csv
 from smart_parser.normalize import normalize_dataframe
 from smart_parser.categorize import add_categories
-from smart_parser.analysis import print_spending_report
+from smart_parser.analysis import compute_spending_by_category, print_spending_totals
+
+
+def prepare_output(df_with_categories):
+    """Select and format the columns written to the cleaned CSV."""
+    # Select columns for output (date, merchant_canonical, amount, category)
+    output_cols = ['date', 'merchant_canonical', 'amount', 'category']
+    df_output = df_with_categories[output_cols].copy()
+    
+    # Format date for readability
+    df_output['date'] = df_output['date'].dt.strftime('%Y-%m-%d')
+    return df_output
 
 
 def main():
@@ -28,42 +40,71 @@ def main():
         help='Optional: Path to save the cleaned/normalized CSV'
     )
     
+    parser.add_argument(
+        '--chunksize',
+        type=int,
+        default=None,
+        help='Optional: Stream the input in chunks of this many rows (for large files)'
+    )
+    
     args = parser.parse_args()
     
-    # Read the messy CSV
+    # Read the messy CSV (a single chunk unless --chunksize is given)
     try:
         print(f"Reading transactions from: {args.input_csv}")
-        df_raw = read_transactions_csv(args.input_csv)
-        print(f"Loaded {len(df_raw)} row(s)")
+        chunks = read_transactions_csv(args.input_csv, chunksize=args.chunksize)
+        if args.chunksize is None:
+            chunks = [chunks]
     except Exception as e:
         print(f"Error reading input file: {e}", file=sys.stderr)
         sys.exit(1)
     
-    # Normalize dates and amounts
-    print("Normalizing dates and amounts...")
-    df_normalized = normalize_dataframe(df_raw)
-    print(f"Valid transactions after normalization: {len(df_normalized)}")
+    # Normalize, categorize and aggregate chunk by chunk; only the running
+    # totals and counters outlive each chunk
+    print("Normalizing and categorizing transactions...")
+    totals = Counter()
+    loaded_count = 0
+    valid_count = 0
+    output_clean = args.output_clean
+    wrote_output = False
     
-    # Add categories
-    print("Categorizing transactions...")
-    df_with_categories = add_categories(df_normalized)
-    
-    # Print analysis report
-    print_spending_report(df_with_categories)
-    
-    # Optionally save cleaned CSV
-    if args.output_clean:
-        try:
-            # Select columns for output (date, merchant_canonical, amount, category)
-            output_cols = ['date', 'merchant_canonical', 'amount', 'category']
-            df_output = df_with_categories[output_cols].copy()
+    # Chunks are read lazily, so a malformed row can still fail here; only
+    # those read errors are caught, processing errors are not read errors
+    try:
+        for i, chunk in enumerate(chunks):
+            df_with_categories = add_categories(normalize_dataframe(chunk))
+            totals.update(compute_spending_by_category(df_with_categories))
+            loaded_count += len(chunk)
+            valid_count += len(df_with_categories)
             
-            # Format date for readability
-            df_output['date'] = df_output['date'].dt.strftime('%Y-%m-%d')
+            # Optionally save cleaned CSV, appending after the first chunk
+            if output_clean:
+                try:
+                    write_clean_csv(prepare_output(df_with_categories), output_clean, append=i > 0)
+                    wrote_output = True
+                except Exception as e:
+                    print(f"Warning: Could not write cleaned CSV: {e}", file=sys.stderr)
+                    output_clean = None
             
-            write_clean_csv(df_output, args.output_clean)
-        except Exception as e:
-            print(f"Warning: Could not write cleaned CSV: {e}", file=sys.stderr)
+            if args.chunksize:
+                print(f"Processed {loaded_count} row(s)...")
+    except ChunkReadError as e:
+        # Same outcome as a failed up-front read: no partial report, and no
+        # half-written cleaned CSV left behind
+        if wrote_output:
+            Path(args.output_clean).unlink(missing_ok=True)
+        print(f"Error reading input file: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    # Only report the cleaned CSV once every chunk has been written
+    if output_clean and wrote_output:
+        print(f"Cleaned data written to: {output_clean}")
+    
+    print(f"Loaded {loaded_count} row(s)")
+    print(f"Valid transactions after normalization: {valid_count}")
+    
+    # Print analysis report
+    print_spending_totals(dict(totals))
 
 
 if __name__ == '__main__':
@@ -1,6 +1,7 @@
 """Analysis functions for finding spending summaries and top categories."""
 
 from typing import Dict, Tuple
+import numpy as np
 import pandas as pd
 
 
@@ -8,6 +9,10 @@ def compute_spending_by_category(df: pd.DataFrame) -> Dict[str, float]:
     """
     Calculate total amount of spending per category using absolute values.
     
+    Returns a plain dict on purpose: the totals are built straight from the
+    category codes, so no pandas Series or label index is created for the
+    handful of categories.
+    
     Args:
         DataFrame with 'category' and 'amount' columns
         
@@ -18,11 +23,29 @@ def compute_spending_by_category(df: pd.DataFrame) -> Dict[str, float]:
         return {}
     
     # Use absolute values to handle both debits and credits
-    df_copy = df.copy()
-    df_copy['amount_abs'] = df_copy['amount'].abs()
+    # (precomputed by normalize_dataframe, derived here for other frames)
+    if 'amount_abs' in df.columns:
+        amount_abs = df['amount_abs']
+    else:
+        amount_abs = df['amount'].abs()
+    
+    # Sum per category code with one bincount pass instead of a hash groupby.
+    # Rows without a category (code -1) are skipped, as groupby would, and
+    # categories with no rows are left out (like observed=True).
+    categories = df['category'].astype('category')
+    codes = categories.cat.codes.to_numpy()
+    weights = amount_abs.fillna(0).to_numpy(dtype=float)
+    present = codes >= 0
+    
+    n_categories = len(categories.cat.categories)
+    sums = np.bincount(codes[present], weights=weights[present], minlength=n_categories)
+    counts = np.bincount(codes[present], minlength=n_categories)
     
-    # Group by category and sum
-    spending = df_copy.groupby('category')['amount_abs'].sum().to_dict()
+    spending = {
+        category: float(total)
+        for category, total, count in zip(categories.cat.categories, sums, counts)
+        if count
+    }
     
     return spending
 
@@ -56,8 +79,16 @@ def print_spending_report(df: pd.DataFrame) -> None:
     Args:
         df: DataFrame with 'category' and 'amount' columns
     """
-    spending = compute_spending_by_category(df)
+    print_spending_totals(compute_spending_by_category(df))
+
+
+def print_spending_totals(spending: Dict[str, float]) -> None:
+    """
+    Print a formatted spending report from precomputed category totals.
     
+    Args:
+        spending: Dictionary mapping category names to total spending
+    """
     if not spending:
         print("No spending data available.")
         return
@@ -70,10 +101,9 @@ def print_spending_report(df: pd.DataFrame) -> None:
     for category, amount in sorted_spending:
         print(f"{category}: ${amount:.2f}")
     
-    # Print top category
-    top = get_top_spending_category(df)
-    if top:
-        print(f"\nTop spending category: {top[0]}")
+    # Print top category (first after sorting, no need to recompute)
+    top = sorted_spending[0]
+    print(f"\nTop spending category: {top[0]}")
     
     print()  # Empty line at end
 
@@ -1,9 +1,92 @@
 """Merchant canonicalization and category mapping logic."""
 
 import re
+from functools import lru_cache
 from typing import Optional
+import numpy as np
 import pandas as pd
 
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator, regex matching is used without it
+    ahocorasick = None
+
+try:
+    import pyarrow  # noqa: F401
+    # Arrow-backed strings run the .str methods as pyarrow.compute kernels
+    _STRING_DTYPE = pd.StringDtype('pyarrow')
+except ImportError:
+    _STRING_DTYPE = pd.StringDtype('python')
+
+# Runs of ASCII whitespace as str.split() sees it. The vectorized path only
+# handles ASCII names (non-ASCII ones go through canonicalize_merchant), but
+# RE2's \s leaves out \v and \x1c-\x1f, so the set is spelled out.
+_WHITESPACE_RUN = r'[\t\n\v\f\r \x1c-\x1f]+'
+
+
+# Category rules, checked in order: the first category with a matching keyword wins
+_CATEGORY_KEYWORDS = [
+    ('Transport', ['UBER', 'LYFT', 'TAXI', 'RIDE']),
+    ('Coffee', ['STARBUCKS', 'DUNKIN', 'COFFEE', 'CAFE']),
+    ('Shopping', ['AMAZON', 'AMZN', 'WALMART', 'TARGET', 'SHOP']),
+    ('Housing', ['RENT', 'HOUSING', 'MORTGAGE', 'UTILITY']),
+    ('Entertainment', ['NETFLIX', 'SPOTIFY', 'ENTERTAINMENT']),
+]
+
+# Every category add_categories can assign, in rule order
+_CATEGORY_NAMES = [category for category, _ in _CATEGORY_KEYWORDS] + ['Other']
+
+# One precompiled alternation per category
+_CAT_PATTERNS = [
+    (category, re.compile('|'.join(re.escape(keyword) for keyword in keywords)))
+    for category, keywords in _CATEGORY_KEYWORDS
+]
+
+
+def _build_automaton():
+    """Build an Aho-Corasick automaton over all keywords, or None if pyahocorasick is missing."""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for priority, (category, keywords) in enumerate(_CATEGORY_KEYWORDS):
+        for keyword in keywords:
+            # A keyword listed under two categories belongs to the earlier one
+            if keyword not in automaton:
+                automaton.add_word(keyword, (priority, category))
+    automaton.make_automaton()
+    return automaton
+
+
+_AUTOMATON = _build_automaton()
+
+
+# Merchant names repeat heavily in statements, so per-name results are cached.
+# Only these private helpers are cached: they take plain str values, so the
+# public functions keep handling unhashable input the way they document.
+@lru_cache(maxsize=4096)
+def _match_category(merchant_upper: str) -> str:
+    """Return the highest-priority category whose keyword appears in an uppercased merchant name."""
+    if _AUTOMATON is not None:
+        # Hits come back in text order, so pick the best priority among them
+        hits = [value for _, value in _AUTOMATON.iter(merchant_upper)]
+        return min(hits)[1] if hits else "Other"
+    
+    for category, pattern in _CAT_PATTERNS:
+        if pattern.search(merchant_upper):
+            return category
+    
+    # Default category
+    return "Other"
+
+
+@lru_cache(maxsize=4096)
+def _canonicalize_str(merchant: str) -> str:
+    """Uppercase a merchant name and normalize its whitespace."""
+    # split() also drops leading/trailing runs
+    canonical = ' '.join(merchant.upper().split())
+    return canonical if canonical else "UNKNOWN"
+
 
 from typing import Optional
 
@@ -21,8 +104,7 @@ def canonicalize_merchant(merchant: Optional[str]) -> str:
         return "UNKNOWN"
     
     # Uppercase and normalize whitespace
-    canonical = re.sub(r'\s+', ' ', merchant.strip().upper())
-    return canonical if canonical else "UNKNOWN"
+    return _canonicalize_str(merchant)
 
 
 def map_merchant_to_category(merchant: str) -> str:
@@ -40,30 +122,59 @@ def map_merchant_to_category(merchant: str) -> str:
     Returns:
         Category name (Transport, Coffee, Shopping, Housing, Other)
     """
-    merchant_upper = merchant.upper()
+    return _match_category(merchant.upper())
+
+
+def _canonicalize_names(names: pd.Series) -> pd.Series:
+    """
+    Canonicalize a Series of merchant names (vectorized canonicalize_merchant).
     
-    # Transport
-    if any(keyword in merchant_upper for keyword in ['UBER', 'LYFT', 'TAXI', 'RIDE']):
-        return "Transport"
+    Args:
+        names: Raw merchant names
+        
+    Returns:
+        string Series of canonicalized names, 'UNKNOWN' for missing or blank ones
+    """
+    # Non-string values (numbers, NaN) count as missing, like in canonicalize_merchant
+    names = names.where(names.map(lambda name: isinstance(name, str)), None)
     
-    # Coffee
-    if any(keyword in merchant_upper for keyword in ['STARBUCKS', 'DUNKIN', 'COFFEE', 'CAFE']):
-        return "Coffee"
+    canonical = (
+        names
+        .astype(_STRING_DTYPE)
+        .str.upper()
+        .str.replace(_WHITESPACE_RUN, ' ', regex=True)
+        .str.strip(' ')
+    )
+    canonical = canonical.fillna('UNKNOWN').replace('', 'UNKNOWN')
     
-    # Shopping
-    if any(keyword in merchant_upper for keyword in ['AMAZON', 'AMZN', 'WALMART', 'TARGET', 'SHOP']):
-        return "Shopping"
+    # Arrow's utf8_upper maps one character to one character, unlike str.upper
+    # ('ß' -> 'SS', 'ﬁ' -> 'FI'), so non-ASCII names use the scalar function.
+    # names holds distinct merchants only, so this loop stays small.
+    non_ascii = np.array([isinstance(name, str) and not name.isascii() for name in names], dtype=bool)
+    if non_ascii.any():
+        canonical[non_ascii] = [canonicalize_merchant(name) for name in names[non_ascii]]
     
-    # Housing
-    if any(keyword in merchant_upper for keyword in ['RENT', 'HOUSING', 'MORTGAGE', 'UTILITY']):
-        return "Housing"
+    return canonical
+
+
+def _categorize_names(canonical: pd.Series) -> np.ndarray:
+    """
+    Map a Series of canonicalized merchant names to categories (vectorized map_merchant_to_category).
     
-    # Entertainment
-    if any(keyword in merchant_upper for keyword in ['NETFLIX', 'SPOTIFY', 'ENTERTAINMENT']):
-        return "Entertainment"
+    Args:
+        canonical: Canonicalized merchant names, no missing values
+        
+    Returns:
+        Array of category names
+    """
+    if _AUTOMATON is not None:
+        # One automaton pass per merchant; the cache carries over between chunks
+        return np.array([map_merchant_to_category(merchant) for merchant in canonical.to_numpy()], dtype=object)
     
-    # Default category
-    return "Other"
+    # First matching rule wins
+    # Plain pattern text lets pandas use Arrow's regex kernel on Arrow-backed strings
+    masks = [canonical.str.contains(pattern.pattern, na=False).to_numpy() for _, pattern in _CAT_PATTERNS]
+    return np.select(masks, [category for category, _ in _CAT_PATTERNS], default='Other').astype(object)
 
 
 def add_categories(df: pd.DataFrame, merchant_col: str = 'merchant') -> pd.DataFrame:
@@ -77,13 +188,19 @@ def add_categories(df: pd.DataFrame, merchant_col: str = 'merchant') -> pd.DataF
     Returns:
         DataFrame with added 'merchant_canonical' and 'category' columns
     """
-    result = df.copy()
+    # Shallow copy: only new columns are added, existing ones are not modified
+    result = df.copy(deep=False)
     
-    # Canonicalize merchants
-    result['merchant_canonical'] = result[merchant_col].apply(canonicalize_merchant)
+    # Statements repeat the same merchants a lot, so only the distinct names are
+    # processed. The extra trailing slot is picked up by code -1 (missing merchant).
+    merchants = pd.Categorical(result[merchant_col])
+    names = pd.Series(list(merchants.categories) + [None], dtype=object)
     
-    # Map to categories
-    result['category'] = result['merchant_canonical'].apply(map_merchant_to_category)
+    canonical = _canonicalize_names(names)
+    categories = _categorize_names(canonical)
+    
+    result['merchant_canonical'] = canonical.to_numpy()[merchants.codes]
+    # Few distinct values, so store them as Categorical codes
+    result['category'] = pd.Categorical(categories[merchants.codes], categories=_CATEGORY_NAMES)
     
     return result
-
@@ -4,10 +4,27 @@ import pandas as pd
 from pathlib import Path
 from typing import Optional
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # optional, pandas' own CSV writer is used without it
+    pa = None
 
-from typing import Union
 
-def read_transactions_csv(file_path: Union[str, Path]) -> pd.DataFrame:
+class ChunkReadError(ValueError):
+    """Raised when a streamed CSV chunk cannot be parsed."""
+
+
+# All raw columns are read as plain strings; normalization does the parsing,
+# so pandas does not need to infer types
+_RAW_DTYPES = {'date': 'string', 'merchant': 'string', 'amount': 'string'}
+
+
+from typing import Iterator, Union
+
+def read_transactions_csv(
+    file_path: Union[str, Path], chunksize: Optional[int] = None
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """
     Read a CSV file of transactions.
     
@@ -15,9 +32,11 @@ def read_transactions_csv(file_path: Union[str, Path]) -> pd.DataFrame:
     
     Args:
         file_path: Path to the CSV file
+        chunksize: Optional number of rows per chunk. When given, the file is
+            streamed and an iterator of DataFrames is returned instead.
         
     Returns:
-        DataFrame with transaction data
+        DataFrame with transaction data, or an iterator of DataFrame chunks
     """
     file_path = Path(file_path)
     
@@ -25,30 +44,77 @@ def read_transactions_csv(file_path: Union[str, Path]) -> pd.DataFrame:
         raise FileNotFoundError(f"CSV file not found: {file_path}")
     
     try:
-        df = pd.read_csv(file_path)
-        
-        # Validate required columns
-        required_cols = ['date', 'merchant', 'amount']
-        missing_cols = [col for col in required_cols if col not in df.columns]
+        # Validate required columns from the header alone
+        header = pd.read_csv(file_path, nrows=0)
+        required_cols = list(_RAW_DTYPES)
+        missing_cols = [col for col in required_cols if col not in header.columns]
         if missing_cols:
             raise ValueError(f"Missing required columns: {missing_cols}")
         
-        return df
+        # No usecols: the full field-count check stays on, so rows with extra
+        # fields are rejected; the required columns are selected afterwards.
+        # Arrow's CSV reader parses on several threads but cannot stream
+        # chunks, so chunked reads (or a missing pyarrow) use pandas' own engines.
+        if pa is not None and chunksize is None:
+            try:
+                df = pd.read_csv(
+                    file_path,
+                    # Keep the columns Arrow-backed for the string kernels downstream
+                    dtype={col: 'string[pyarrow]' for col in required_cols},
+                    engine='pyarrow',
+                )
+                return df[required_cols]
+            except pd.errors.ParserError:
+                # Arrow also rejects rows with missing fields, which the C engine
+                # pads with NA; let the C engine decide so both paths agree
+                pass
+        
+        if chunksize is not None:
+            # The C engine skips the field-count check on the first row of
+            # every chunk after the first, so rows with extra fields could slip
+            # through at chunk boundaries; the python engine checks every row
+            reader = pd.read_csv(
+                file_path,
+                dtype=_RAW_DTYPES,
+                engine='python',
+                chunksize=chunksize,
+            )
+            return _iter_chunks(reader, required_cols)
+        
+        df = pd.read_csv(file_path, dtype=_RAW_DTYPES, engine='c')
+        return df[required_cols]
     except pd.errors.EmptyDataError:
         raise ValueError(f"CSV file is empty: {file_path}")
     except Exception as e:
         raise RuntimeError(f"Error reading CSV file: {e}")
 
 
+def _iter_chunks(reader, columns) -> Iterator[pd.DataFrame]:
+    """
+    Yield the given columns of each chunk from a pandas chunk reader.
+    
+    Chunks are parsed lazily, so malformed rows only show up while iterating;
+    those errors are raised as ChunkReadError (a ValueError) so callers can
+    tell them apart from errors in their own processing of a chunk.
+    """
+    with reader:
+        try:
+            for chunk in reader:
+                yield chunk[columns]
+        except Exception as e:
+            raise ChunkReadError(f"Error reading CSV file: {e}")
+
+
 from typing import Union  # already at the top
 
-def write_clean_csv(df: pd.DataFrame, file_path: Union[str, Path]) -> None:
+def write_clean_csv(df: pd.DataFrame, file_path: Union[str, Path], append: bool = False) -> None:
     """
     Write a cleaned DataFrame to a CSV file.
     
     Args:
         df: DataFrame to write
         file_path: Path where the CSV should be written
+        append: Append rows without a header (for writing chunk by chunk)
     """
     file_path = Path(file_path)
     
@@ -56,8 +122,16 @@ def write_clean_csv(df: pd.DataFrame, file_path: Union[str, Path]) -> None:
     file_path.parent.mkdir(parents=True, exist_ok=True)
     
     try:
-        df.to_csv(file_path, index=False)
-        print(f"Cleaned data written to: {file_path}")
+        if pa is not None:
+            # Arrow's C++ writer formats and quotes whole columns at once
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            options = pacsv.WriteOptions(include_header=not append)
+            with open(file_path, 'ab' if append else 'wb') as sink:
+                pacsv.write_csv(table, sink, write_options=options)
+        elif append:
+            df.to_csv(file_path, index=False, mode='a', header=False)
+        else:
+            df.to_csv(file_path, index=False)
     except Exception as e:
         raise RuntimeError(f"Error writing CSV file: {e}")
 
@@ -7,6 +7,14 @@ from dateutil import parser as date_parser
 import pandas as pd
 
 
+# Everything except ASCII digits, decimal points and minus signs is noise in an
+# amount (currency symbols, codes like USD, thousand separators, stray whitespace).
+# Digits are spelled 0-9 rather than \d: Python's \d also matches other scripts'
+# digits but Arrow's RE2 engine does not, and both paths must agree.
+# Compiled once at import so per-value parsing skips the re module's cache lookup.
+_AMT_STRIP = re.compile(r'[^0-9.\-]')
+
+
 from typing import Optional
 
 def parse_date_safe(raw: Optional[str]) -> Optional[pd.Timestamp]:
@@ -53,6 +61,8 @@ def parse_amount_safe(raw: Union[str, float, int, None]) -> Optional[float]:
     - Commas: $1,200.00
     - Whitespace: $ 12.34, 15.00 USD
     
+    Only ASCII digits 0-9 count; digits from other scripts are stripped.
+    
     Args:
         raw: Raw amount string or numeric value
         
@@ -74,15 +84,9 @@ def parse_amount_safe(raw: Union[str, float, int, None]) -> Optional[float]:
         return None
     
     try:
-        # Remove currency symbols and letters (USD, EUR, etc.)
-        # Keep digits, decimal points, commas, and minus signs
-        cleaned = re.sub(r'[^\d.,-]', '', raw)
-        
-        # Remove commas (thousand separators)
-        cleaned = cleaned.replace(',', '')
-        
-        # Handle negative signs that might have spaces
-        cleaned = cleaned.replace(' ', '')
+        # Remove currency symbols, letters (USD, EUR, etc.), commas and spaces
+        # Keep digits, decimal points, and minus signs
+        cleaned = _AMT_STRIP.sub('', raw)
         
         if not cleaned or cleaned == '-':
             return None
@@ -93,6 +97,65 @@ def parse_amount_safe(raw: Union[str, float, int, None]) -> Optional[float]:
         return None
 
 
+def _parse_date_column(dates: pd.Series) -> pd.Series:
+    """
+    Parse a whole column of messy dates at once.
+    
+    pandas handles the common formats (ISO, US) in a single batched call;
+    only the rows it cannot parse, or that may be missing a year, month or
+    day, go through parse_date_safe's fuzzy parser. Non-string values are
+    treated as unparseable.
+    
+    Args:
+        dates: Series of raw date strings
+        
+    Returns:
+        datetime64 Series, NaT where the date could not be parsed
+    """
+    # Only strings are dates, like in parse_date_safe; pandas would otherwise
+    # read numbers such as 20230105 as epoch nanoseconds
+    if not pd.api.types.is_string_dtype(dates):
+        dates = dates.where(dates.map(lambda raw: isinstance(raw, str)), None)
+    
+    parsed = pd.to_datetime(dates, errors='coerce', format='mixed', dayfirst=False)
+    
+    # Retry the leftovers with dateutil's fuzzy parsing. pandas fills in missing
+    # parts with fixed values (year 1 for "Jan 5", day 1 for "Jan 2023" or
+    # "2023"), while dateutil takes them from today's date like parse_date_safe.
+    # Any result on day 1 is therefore re-parsed too; complete dates come back
+    # unchanged. Statements repeat the same date strings, so each distinct
+    # leftover is parsed only once.
+    incomplete = (parsed.dt.year < 1000) | (parsed.dt.day == 1)
+    leftover = (parsed.isna() | incomplete) & dates.notna()
+    if leftover.any():
+        leftovers = dates.loc[leftover]
+        distinct = leftovers.unique()
+        lookup = pd.Series(pd.to_datetime([parse_date_safe(raw) for raw in distinct]), index=distinct)
+        parsed.loc[leftover] = leftovers.map(lookup)
+    
+    return parsed
+
+
+def _parse_amount_column(amounts: pd.Series) -> pd.Series:
+    """
+    Parse a whole column of messy amounts at once.
+    
+    Args:
+        amounts: Series of raw amount strings or numbers
+        
+    Returns:
+        float64 Series, NaN where the amount could not be parsed
+    """
+    # Numeric columns are already parsed
+    if pd.api.types.is_numeric_dtype(amounts):
+        return amounts.astype('float64')
+    
+    # Pass the pattern text, not the compiled object: pandas can only hand a
+    # plain pattern to Arrow's regex kernel and falls back to per-row re calls otherwise
+    cleaned = amounts.astype('string').str.replace(_AMT_STRIP.pattern, '', regex=True)
+    return pd.to_numeric(cleaned, errors='coerce').astype('float64')
+
+
 def normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """
     Normalize a DataFrame of transactions by parsing dates and amounts.
@@ -103,19 +166,26 @@ def normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
         df: Raw DataFrame with columns: date, merchant, amount
         
     Returns:
-        Normalized DataFrame with parsed dates and amounts, invalid rows removed
+        Normalized DataFrame with parsed dates and amounts plus an 'amount_abs'
+        column, invalid rows removed
     """
     if df.empty:
-        return df.copy()
+        # Same columns and dtypes as a normalized frame, just without rows
+        normalized = df.copy(deep=False)
+        normalized['date'] = pd.to_datetime(normalized['date'])
+        normalized['amount'] = normalized['amount'].astype('float64')
+        normalized['amount_abs'] = normalized['amount'].abs()
+        return normalized
     
-    # Create a copy to avoid modifying the original
-    normalized = df.copy()
+    # Shallow copy: columns are only ever replaced, never modified in place,
+    # so the caller's frame stays untouched without duplicating its data
+    normalized = df.copy(deep=False)
     
-    # Parse dates
-    normalized['date'] = normalized['date'].apply(parse_date_safe)
+    # Parse dates (batched, with fuzzy fallback for the leftovers)
+    normalized['date'] = _parse_date_column(normalized['date'])
     
-    # Parse amounts
-    normalized['amount'] = normalized['amount'].apply(parse_amount_safe)
+    # Parse amounts (vectorized; same rules as parse_amount_safe)
+    normalized['amount'] = _parse_amount_column(normalized['amount'])
     
     # Drop rows where date or amount is None (invalid)
     initial_count = len(normalized)
@@ -131,5 +201,8 @@ def normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     # Reset index after dropping rows
     normalized = normalized.reset_index(drop=True)
     
+    # Absolute amounts, computed once here for all spending aggregations
+    normalized['amount_abs'] = normalized['amount'].abs()
+    
     return normalized
 
@@ -3,7 +3,7 @@
 import pytest
 import pandas as pd
 from smart_parser.categorize import canonicalize_merchant, map_merchant_to_category, add_categories
-from smart_parser.analysis import compute_spending_by_category, get_top_spending_category
+from smart_parser.analysis import compute_spending_by_category, get_top_spending_category, print_spending_report
 
 
 class TestCanonicalizeMerchant:
@@ -26,6 +26,10 @@ class TestCanonicalizeMerchant:
     def test_empty_string(self):
         """Test that empty string returns UNKNOWN"""
         assert canonicalize_merchant("") == "UNKNOWN"
+    
+    def test_unhashable_input(self):
+        """Test that unhashable non-string input returns UNKNOWN"""
+        assert canonicalize_merchant(['x']) == "UNKNOWN"
 
 
 class TestMapMerchantToCategory:
@@ -95,6 +99,48 @@ class TestAddCategories:
         assert result.loc[0, 'category'] == 'Transport'
         assert result.loc[1, 'category'] == 'Coffee'
         assert result.loc[2, 'category'] == 'Shopping'
+        assert isinstance(result['category'].dtype, pd.CategoricalDtype)
+    
+    def test_add_categories_leaves_input_unchanged(self):
+        """Test that the caller's DataFrame does not gain new columns"""
+        df = pd.DataFrame({'merchant': ['UBER *TRIP'], 'amount': [10.0]})
+        
+        add_categories(df)
+        
+        assert list(df.columns) == ['merchant', 'amount']
+    
+    def test_add_categories_matches_scalar_functions(self):
+        """Test that the vectorized path agrees with the per-merchant functions"""
+        merchants = ['  uber   eats ', None, '   ', 'Coffee Shop', 'Netflix', 'Random Store', 'lyft\xa0\tinc\u3000',
+                     'straße', '\ufb01sh cafe', 'Café Noir']
+        df = pd.DataFrame({'merchant': merchants})
+        
+        result = add_categories(df)
+        
+        expected_canonical = [canonicalize_merchant(m) for m in merchants]
+        assert list(result['merchant_canonical']) == expected_canonical
+        assert list(result['category']) == [map_merchant_to_category(m) for m in expected_canonical]
+    
+    def test_add_categories_non_string_merchants(self):
+        """Test that non-string merchants become UNKNOWN, like canonicalize_merchant"""
+        df = pd.DataFrame({'merchant': [123, 4.5, 'Uber']})
+        
+        result = add_categories(df)
+        
+        assert list(result['merchant_canonical']) == ['UNKNOWN', 'UNKNOWN', 'UBER']
+        assert list(result['category']) == ['Other', 'Other', 'Transport']
+    
+    def test_add_categories_without_automaton(self, monkeypatch):
+        """Test that the regex fallback gives the same categories as the automaton"""
+        from smart_parser import categorize
+        df = pd.DataFrame({'merchant': ['STARBUCKS RIDE', 'Uber', 'Coffee Shop', 'Netflix', 'Random Store']})
+        
+        expected = list(add_categories(df)['category'])
+        monkeypatch.setattr(categorize, '_AUTOMATON', None)
+        result = add_categories(df)
+        
+        assert list(result['category']) == expected
+        assert expected == ['Transport', 'Transport', 'Coffee', 'Entertainment', 'Other']
 
 
 class TestComputeSpendingByCategory:
@@ -111,12 +157,36 @@ class TestComputeSpendingByCategory:
         
         assert spending['Transport'] == 15.0  # abs(10) + abs(-5)
         assert spending['Coffee'] == 5.0  # abs(3) + abs(2)
+        assert type(spending) is dict
+        assert all(type(total) is float for total in spending.values())
     
     def test_empty_dataframe(self):
         """Test with empty DataFrame"""
         df = pd.DataFrame(columns=['category', 'amount'])
         spending = compute_spending_by_category(df)
         assert spending == {}
+    
+    def test_categorical_unobserved_categories(self):
+        """Test that unused categories of a Categorical column are left out"""
+        df = pd.DataFrame({
+            'category': pd.Categorical(['Coffee', 'Coffee'], categories=['Transport', 'Coffee']),
+            'amount': [3.0, -2.0]
+        })
+        
+        spending = compute_spending_by_category(df)
+        
+        assert spending == {'Coffee': 5.0}
+    
+    def test_missing_category_and_amount(self):
+        """Test that rows without a category are skipped and missing amounts count as zero"""
+        df = pd.DataFrame({
+            'category': ['Coffee', None, 'Coffee', 'Transport'],
+            'amount': [3.0, 100.0, None, -2.0]
+        })
+        
+        spending = compute_spending_by_category(df)
+        
+        assert spending == {'Coffee': 3.0, 'Transport': 2.0}
 
 
 class TestGetTopSpendingCategory:
@@ -142,6 +212,28 @@ class TestGetTopSpendingCategory:
         assert top is None
 
 
+class TestPrintSpendingReport:
+    """Test the printed spending report."""
+    
+    def test_report_sorted_with_top_category(self, capsys):
+        """Test that the report is sorted descending and names the top category"""
+        df = pd.DataFrame({
+            'category': ['Transport', 'Coffee', 'Shopping', 'Coffee'],
+            'amount': [10.0, -3.0, 100.0, 2.0]
+        })
+        
+        print_spending_report(df)
+        out = capsys.readouterr().out
+        
+        assert out.index('Shopping: $100.00') < out.index('Transport: $10.00') < out.index('Coffee: $5.00')
+        assert 'Top spending category: Shopping' in out
+    
+    def test_report_empty(self, capsys):
+        """Test the report with no data"""
+        print_spending_report(pd.DataFrame(columns=['category', 'amount']))
+        assert 'No spending data available.' in capsys.readouterr().out
+
+
 class TestIntegration:
     """Integration test for the full pipeline."""
     
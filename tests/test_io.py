@@ -0,0 +1,116 @@
+"""Tests for CSV reading and writing."""
+
+import pytest
+import pandas as pd
+from smart_parser.io import ChunkReadError, read_transactions_csv, write_clean_csv
+
+
+CSV_TEXT = (
+    "date,merchant,amount\n"
+    "2023-01-01,UBER *TRIP,$12.34\n"
+    "Jan 1st 23,Uber,15.00 USD\n"
+    "01/01/2023,STARBUCKS,-$8.50\n"
+)
+
+
+@pytest.fixture(params=['pyarrow', 'pandas'])
+def read_engine(request, monkeypatch):
+    """Run a test with pyarrow (skipped if not installed) and with pandas alone"""
+    from smart_parser import io
+    if request.param == 'pandas':
+        monkeypatch.setattr(io, 'pa', None)
+    elif io.pa is None:
+        pytest.skip("pyarrow not installed")
+    return request.param
+
+
+class TestReadTransactionsCsv:
+    """Test reading transaction CSVs."""
+    
+    def test_read_whole_file(self, tmp_path, read_engine):
+        """Test that the whole file is read into one DataFrame, with and without pyarrow"""
+        path = tmp_path / "transactions.csv"
+        path.write_text(CSV_TEXT)
+        
+        df = read_transactions_csv(path)
+        
+        assert len(df) == 3
+        assert list(df.columns) == ['date', 'merchant', 'amount']
+        assert list(df['amount']) == ['$12.34', '15.00 USD', '-$8.50']
+    
+    def test_read_as_strings(self, tmp_path):
+        """Test that raw columns are read as strings and extra columns are skipped"""
+        path = tmp_path / "transactions.csv"
+        path.write_text("date,merchant,amount,note\n2023-01-01,UBER,12.34,x\n")
+        
+        df = read_transactions_csv(path)
+        
+        assert list(df.columns) == ['date', 'merchant', 'amount']
+        assert pd.api.types.is_string_dtype(df['amount'])
+        assert df.loc[0, 'amount'] == '12.34'
+    
+    def test_read_in_chunks(self, tmp_path):
+        """Test that chunksize streams the file as DataFrame chunks"""
+        path = tmp_path / "transactions.csv"
+        path.write_text(CSV_TEXT)
+        
+        chunks = list(read_transactions_csv(path, chunksize=2))
+        
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert list(pd.concat(chunks)['merchant']) == ['UBER *TRIP', 'Uber', 'STARBUCKS']
+    
+    def test_malformed_row_in_chunks(self, tmp_path):
+        """Test that a parse error while streaming is raised as ValueError"""
+        path = tmp_path / "transactions.csv"
+        path.write_text(CSV_TEXT + '2023-01-03,"C,3\n2023-01-04,D,4\n')
+        
+        chunks = read_transactions_csv(path, chunksize=1)
+        
+        with pytest.raises(ChunkReadError, match="Error reading CSV file"):
+            list(chunks)
+    
+    @pytest.mark.parametrize("chunksize", [None, 1])
+    def test_field_count_checks(self, tmp_path, read_engine, chunksize):
+        """Test that every read path rejects extra fields and pads missing ones"""
+        extra = tmp_path / "extra.csv"
+        extra.write_text(CSV_TEXT + "2023-01-03,C,3,extra,x\n")
+        with pytest.raises(Exception, match="Expected 3 fields"):
+            result = read_transactions_csv(extra, chunksize=chunksize)
+            if chunksize is not None:
+                list(result)
+        
+        short = tmp_path / "short.csv"
+        short.write_text(CSV_TEXT + "2023-01-03,C\n")
+        result = read_transactions_csv(short, chunksize=chunksize)
+        if chunksize is not None:
+            result = pd.concat(list(result), ignore_index=True)
+        assert len(result) == 4
+        assert pd.isna(result.loc[3, 'amount'])
+    
+    def test_missing_file(self, tmp_path):
+        """Test that a missing file raises FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            read_transactions_csv(tmp_path / "missing.csv")
+    
+    def test_missing_columns(self, tmp_path):
+        """Test that missing required columns are reported"""
+        path = tmp_path / "transactions.csv"
+        path.write_text("date,amount\n2023-01-01,$1.00\n")
+        
+        with pytest.raises(Exception, match="Missing required columns"):
+            read_transactions_csv(path, chunksize=10)
+
+
+class TestWriteCleanCsv:
+    """Test writing cleaned CSVs."""
+    
+    def test_append_chunks(self, tmp_path, read_engine):
+        """Test that appended chunks share a single header, with and without pyarrow"""
+        path = tmp_path / "out" / "clean.csv"
+        
+        write_clean_csv(pd.DataFrame({'merchant': ['UBER'], 'amount': [1.0]}), path)
+        write_clean_csv(pd.DataFrame({'merchant': ['LYFT'], 'amount': [2.0]}), path, append=True)
+        
+        result = pd.read_csv(path)
+        assert list(result['merchant']) == ['UBER', 'LYFT']
+        assert list(result['amount']) == [1.0, 2.0]
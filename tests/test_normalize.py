@@ -107,6 +107,18 @@ class TestParseAmountSafe:
         assert parse_amount_safe("NOT_A_NUMBER") is None
         assert parse_amount_safe("INVALID AMOUNT") is None
     
+    def test_non_ascii_digits(self):
+        """Test that only ASCII digits are parsed, in the scalar and vectorized paths"""
+        assert parse_amount_safe("\u0661\u0662") is None
+        
+        df = pd.DataFrame({
+            'date': ['2023-01-01', '2023-01-02'],
+            'merchant': ['UBER', 'LYFT'],
+            'amount': ['\u0661\u0662', '$12.00']
+        })
+        result = normalize_dataframe(df)
+        assert list(result['amount']) == [12.0]
+    
     def test_none_input(self):
         """Test that None input returns None"""
         assert parse_amount_safe(None) is None
@@ -149,9 +161,103 @@ class TestNormalizeDataframe:
         assert all(result['date'].notna())
         assert all(result['amount'].notna())
     
+    def test_normalize_leaves_input_unchanged(self):
+        """Test that the caller's DataFrame is not modified"""
+        df = pd.DataFrame({
+            'date': ['2023-01-01', 'INVALID DATE'],
+            'merchant': ['UBER', 'LYFT'],
+            'amount': ['$12.34', '$1.00']
+        })
+        original = df.copy()
+        
+        normalize_dataframe(df)
+        
+        pd.testing.assert_frame_equal(df, original)
+    
     def test_normalize_empty_dataframe(self):
         """Test normalization with empty DataFrame"""
         df = pd.DataFrame(columns=['date', 'merchant', 'amount'])
         result = normalize_dataframe(df)
         assert len(result) == 0
+        assert list(result.columns) == ['date', 'merchant', 'amount', 'amount_abs']
+        assert pd.api.types.is_datetime64_any_dtype(result['date'])
+        assert pd.api.types.is_float_dtype(result['amount_abs'])
 
+    
+    def test_normalize_parses_messy_amounts(self):
+        """Test that the amount column is parsed like parse_amount_safe"""
+        df = pd.DataFrame({
+            'date': ['2023-01-01', '2023-01-02', '2023-01-03'],
+            'merchant': ['UBER', 'RENT', 'LYFT'],
+            'amount': ['$1,200.00', '- 3.25 USD', '-$8.50']
+        })
+        
+        result = normalize_dataframe(df)
+        
+        assert list(result['amount']) == [1200.00, -3.25, -8.50]
+        assert list(result['amount_abs']) == [1200.00, 3.25, 8.50]
+    
+    def test_normalize_numeric_amounts(self):
+        """Test that already-numeric amounts pass through"""
+        df = pd.DataFrame({
+            'date': ['2023-01-01', '2023-01-02'],
+            'merchant': ['UBER', 'LYFT'],
+            'amount': [12.34, -5]
+        })
+        
+        result = normalize_dataframe(df)
+        
+        assert list(result['amount']) == [12.34, -5.0]
+    
+    def test_normalize_mixed_date_formats(self):
+        """Test that batched and fuzzy-parsed dates end up in one column"""
+        df = pd.DataFrame({
+            'date': ['2023-01-01', '01/02/2023', 'Jan 3rd 23'],
+            'merchant': ['UBER', 'LYFT', 'STARBUCKS'],
+            'amount': ['$1.00', '$2.00', '$3.00']
+        })
+        
+        result = normalize_dataframe(df)
+        
+        assert list(result['date'].dt.day) == [1, 2, 3]
+        assert all(result['date'].dt.year == 2023)
+    
+    def test_normalize_date_without_year(self):
+        """Test that dates without a year get the current year, like parse_date_safe"""
+        df = pd.DataFrame({
+            'date': ['Jan 3rd 23', 'Jan 5', '01/05'],
+            'merchant': ['UBER', 'LYFT', 'STARBUCKS'],
+            'amount': ['$1.00', '$2.00', '$3.00']
+        })
+        
+        result = normalize_dataframe(df)
+        
+        expected_year = parse_date_safe('Jan 5').year
+        assert list(result['date'].dt.year) == [2023, expected_year, expected_year]
+        assert list(result['date'].dt.month) == [1, 1, 1]
+        assert list(result['date'].dt.day) == [3, 5, 5]
+    
+    def test_normalize_date_without_day_or_month(self):
+        """Test that dates missing a day or month match parse_date_safe"""
+        raw_dates = ['Jan 2023', '2023', '2023-01-01']
+        df = pd.DataFrame({
+            'date': raw_dates,
+            'merchant': ['UBER', 'LYFT', 'STARBUCKS'],
+            'amount': ['$1.00', '$2.00', '$3.00']
+        })
+        
+        result = normalize_dataframe(df)
+        
+        assert list(result['date']) == [parse_date_safe(raw) for raw in raw_dates]
+    
+    def test_normalize_numeric_dates_dropped(self):
+        """Test that non-string dates are rejected, not read as epoch timestamps"""
+        df = pd.DataFrame({
+            'date': [20230105, 20230106],
+            'merchant': ['UBER', 'LYFT'],
+            'amount': [1.0, 2.0]
+        })
+        
+        result = normalize_dataframe(df)
+        
+        assert len(result) == 0